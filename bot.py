@@ -10,6 +10,7 @@ Auto-reconnect, latency monitoring, and fault-tolerant loops.
 import sys, functools, asyncio, configparser, logging, humanize, requests, discord
 from discord import Option, ApplicationContext
 from discord.ext import commands
+from dataclasses import dataclass
 from urllib.parse import parse_qsl, urlencode
 
 # ──────────────────────────────────────────────────────────────
@@ -115,7 +116,6 @@ qbit.login()
 # ──────────────────────────────────────────────────────────────
 intents = discord.Intents.default()
 intents.messages = True
-intents.reactions = True
 intents.message_content = True
 bot = commands.Bot(command_prefix="!", intents=intents)
 bot.remove_command("help")
@@ -215,73 +215,131 @@ async def handle_magnet_download(channel, magnet_link, category):
             title="Error", description=str(e), color=discord.Color.red()
         ))
 
+# ──────────────────────────────────────────────────────────────
+# SEARCH RESULTS (typed records + pre-rendered embeds)
+# ──────────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class SearchResult:
+    title: str
+    size: str
+    seeders: str
+    leechers: str
+    date: str
+    magnet_link: str
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SearchResult":
+        return cls(
+            title=str(data.get("title", ""))[:256] or "Untitled",
+            size=str(data.get("size", "")) or "?",
+            seeders=str(data.get("seeders", "")) or "?",
+            leechers=str(data.get("leechers", "")) or "?",
+            date=str(data.get("date", "")) or "?",
+            magnet_link=data.get("magnet_link", "") or "",
+        )
+
+def fetch_results(query: str, limit: int = len(emoji_list)) -> list[SearchResult]:
+    """Query the backend and parse the JSON payload into typed records (blocking)."""
+    r = requests.get(f"{API_URL}/torrents", params={"q": query}, timeout=10)
+    r.raise_for_status()
+    return [SearchResult.from_dict(d) for d in r.json()[:limit]]
+
+def build_result_embeds(results: list[SearchResult]) -> list[discord.Embed]:
+    """Render the provider notice plus one embed per result, ready to post in a single message."""
+    embeds = [discord.Embed(
+        title="⚠️ Provider Notice",
+        description="Results from **1377x.to**; pick a button below to add torrent (auto-timeout 60s).",
+        color=discord.Color.gold()
+    )]
+    for i, res in enumerate(results):
+        e = discord.Embed(title=f"{emoji_list[i]} {res.title}"[:256], color=discord.Color.blurple())
+        e.add_field(name="Size", value=res.size, inline=True)
+        e.add_field(name="Seeders", value=res.seeders, inline=True)
+        e.add_field(name="Leechers", value=res.leechers, inline=True)
+        e.add_field(name="Date", value=res.date, inline=True)
+        embeds.append(e)
+    return embeds
+
+class SearchResultView(discord.ui.View):
+    """One button per result; only the invoking user may pick, first pick wins."""
+
+    def __init__(self, user, results: list[SearchResult], timeout: float = 60.0):
+        super().__init__(timeout=timeout)
+        self.user = user
+        self.results = results
+        self.message = None
+        for i, res in enumerate(results):
+            button = discord.ui.Button(
+                label=str(i + 1), emoji=emoji_list[i], style=discord.ButtonStyle.primary,
+                disabled=not res.magnet_link
+            )
+            button.callback = functools.partial(self.select, i, button)
+            self.add_item(button)
+
+    def disable_all(self):
+        for item in self.children:
+            item.disabled = True
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id == self.user.id:
+            return True
+        await interaction.response.send_message(
+            embed=discord.Embed(
+                title="Not your search", description="Run `/search` to pick your own torrent.",
+                color=discord.Color.orange()
+            ),
+            ephemeral=True
+        )
+        return False
+
+    async def select(self, index: int, button: discord.ui.Button, interaction: discord.Interaction):
+        res = self.results[index]
+        self.disable_all()
+        button.style = discord.ButtonStyle.success
+        self.stop()
+        await interaction.response.edit_message(view=self)
+        logger.info("Selected result %d: %s", index + 1, res.title)
+        bot.loop.create_task(handle_magnet_download(interaction.channel, res.magnet_link, "Movie"))
+
+    async def on_timeout(self):
+        self.disable_all()
+        if self.message is None:
+            return
+        try:
+            await self.message.edit(
+                embeds=self.message.embeds + [discord.Embed(
+                    title="⌛ Timeout", description="No selection was made within 60 seconds.",
+                    color=discord.Color.dark_grey()
+                )],
+                view=self
+            )
+        except discord.HTTPException:
+            logger.warning("Timeout edit failed; message may be gone.")
+
 # ──────────────────────────────────────────────────────────────
 # SEARCH COMMAND
 # ──────────────────────────────────────────────────────────────
 @bot.slash_command(name="search", description="Search for torrents.", guild_ids=guild_ids)
 async def search(ctx: ApplicationContext, query: Option(str, "Specify search query", required=True)):
     logger.info("Search query: %s", query)
-    await ctx.respond(embed=discord.Embed(title="Searching...", color=discord.Color.blue()), ephemeral=True)
+    await ctx.defer()
 
     try:
-        r = await run_blocking(requests.get, f"{API_URL}/torrents?q={query}", timeout=10)
-        results = r.json()
+        results = await run_blocking(fetch_results, query)
         if not results:
-            await ctx.send(embed=discord.Embed(
+            await ctx.followup.send(embed=discord.Embed(
                 title="No Results Found", description="Try another search.",
                 color=discord.Color.orange()
             ))
             return
 
-        await ctx.send(embed=discord.Embed(
-            title="⚠️ Provider Notice",
-            description="Results from **1377x.to**; react below to add torrent (auto-timeout 60s).",
-            color=discord.Color.gold()
-        ))
-
-        sent_messages = []
-        for i, res in enumerate(results[:len(emoji_list)]):
-            e = discord.Embed(title=res["title"], color=discord.Color.blurple())
-            e.add_field(name="Size", value=res["size"], inline=True)
-            e.add_field(name="Seeders", value=res["seeders"], inline=True)
-            e.add_field(name="Leechers", value=res["leechers"], inline=True)
-            e.add_field(name="Date", value=res["date"], inline=True)
-            safe_magnet = trim_magnet(res["magnet_link"])
-            e.add_field(name="Magnet Link", value=f"```{safe_magnet}```", inline=False)
-            m = await ctx.send(embed=e)
-            await m.add_reaction(emoji_list[i])
-            sent_messages.append(m)
-
-        def check(reaction, user):
-            return user == ctx.user and str(reaction.emoji) in emoji_list and reaction.message in sent_messages
-
-        try:
-            reaction, user = await bot.wait_for("reaction_add", timeout=60.0, check=check)
-        except asyncio.TimeoutError:
-            await ctx.send(embed=discord.Embed(
-                title="⌛ Timeout", description="No selection was made within 60 seconds.",
-                color=discord.Color.dark_grey()
-            ))
-            return
-
-        msg = reaction.message
-        magnet_field = next((f for f in msg.embeds[0].fields if f.name == "Magnet Link"), None)
-        if magnet_field:
-            magnet = magnet_field.value.strip("```")
-            await ctx.send(embed=discord.Embed(
-                title="Torrent Added via Reaction",
-                description="Added to **Movie** category. Fetching progress...",
-                color=discord.Color.green()
-            ))
-            bot.loop.create_task(handle_magnet_download(ctx.channel, magnet, "Movie"))
-        else:
-            await ctx.send(embed=discord.Embed(
-                title="Error", description="Could not extract magnet link.", color=discord.Color.red()
-            ))
+        embeds = await run_blocking(build_result_embeds, results)
+        view = SearchResultView(ctx.user, results)
+        view.message = await ctx.followup.send(embeds=embeds, view=view, wait=True)
 
     except Exception as e:
         logger.error("Search error: %s", e)
-        await ctx.send(embed=discord.Embed(title="Error", description=str(e), color=discord.Color.red()))
+        await ctx.followup.send(embed=discord.Embed(title="Error", description=str(e), color=discord.Color.red()))
 
 # ──────────────────────────────────────────────────────────────
 # MAIN ENTRY